@@ -1,5 +1,6 @@
 # assets.py - Load images, sounds, and fonts from the assets directory.
 
+import functools
 import os
 from typing import Optional
 
@@ -14,8 +15,9 @@ def load_image(
     background: Optional[tuple[int, int, int]] = None,
 ) -> Optional[pygame.Surface]:
     """
-    Load an image from ASSET_DIR. Uses convert_alpha() for PNGs with
-    transparency (unless flattened — see background).
+    Load an image from ASSET_DIR. Uses convert_alpha() for PNGs
+    (unless flattened — see background). ``scale`` is skipped when the
+    image is already that size.
 
     If ``background`` is an RGB triplet, the (possibly scaled) image is
     composited onto that color and returned as a solid surface. Use this for
@@ -29,16 +31,10 @@ def load_image(
         print(f"⚠️ Failed to load image '{path}': {e}")
         return None
 
-    has_alpha = False
-    if filename.lower().endswith(".png"):
-        try:
-            if img.get_alpha() is not None or (img.get_flags() & pygame.SRCALPHA):
-                has_alpha = True
-        except Exception:
-            pass
-
+    # Trust the extension: convert_alpha() is harmless on an opaque PNG and saves probing SDL.
+    has_alpha = filename.lower().endswith(".png")
     img = img.convert_alpha() if has_alpha else img.convert()
-    if scale:
+    if scale and tuple(scale) != img.get_size():
         img = pygame.transform.smoothscale(img, scale)
     if background is not None:
         base = pygame.Surface(img.get_size())
@@ -49,7 +45,11 @@ def load_image(
 
 
 def load_sound(filename: str, volume: float = 1.0) -> Optional[pygame.mixer.Sound]:
-    """Load a sound from ASSET_DIR and set volume. Returns None on failure."""
+    """Load a sound from ASSET_DIR and set volume. Returns None on failure.
+
+    ``mixer.Sound`` decodes the whole file into the mixer's output format at load time,
+    so nothing is left to warm up before the first trigger.
+    """
     path = os.path.join(ASSET_DIR, filename)
     try:
         sound = pygame.mixer.Sound(path)
@@ -60,6 +60,7 @@ def load_sound(filename: str, volume: float = 1.0) -> Optional[pygame.mixer.Soun
         return None
 
 
+@functools.lru_cache(maxsize=32)
 def load_font(size: int, bold: bool = False) -> pygame.font.Font:
-    """Return Courier New system font at given size."""
+    """Return Courier New system font at given size (one Font per size/bold; SysFont scans are slow)."""
     return pygame.font.SysFont("Courier New", size, bold=bold)
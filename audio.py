@@ -1,50 +1,135 @@
 # audio.py - Sound effects and ambient music for the pinball scoreboard.
 
+import os
+import threading
+import wave
+
 import pygame
 
-from assets import load_sound
+from assets import ASSET_DIR, load_sound
 
 # ---------------------------------------------------------------------------
 # Mixer
 # ---------------------------------------------------------------------------
 
-pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+# Samples per mixer callback. Smaller = lower hit-to-sound latency (256 @ 44.1 kHz ~ 6 ms)
+# but more callbacks; raise to 512/1024 if the Pi's audio crackles under load.
+MIXER_BUFFER = 256
+# SFX clip the mixer rate is matched to, so short effects play without resampling.
+MIXER_RATE_SOURCE = "hit.wav"
+MIXER_DEFAULT_FREQUENCY = 44100
+
+
+def _detect_sample_rate(filename: str, default: int = MIXER_DEFAULT_FREQUENCY) -> int:
+    """Sample rate of a WAV in ASSET_DIR, or default if it cannot be read."""
+    try:
+        with wave.open(os.path.join(ASSET_DIR, filename)) as wav:
+            return wav.getframerate()
+    except (OSError, EOFError, wave.Error):
+        return default
+
+
+pygame.mixer.init(
+    frequency=_detect_sample_rate(MIXER_RATE_SOURCE),
+    size=-16,
+    channels=2,
+    buffer=MIXER_BUFFER,
+)
 
 # ---------------------------------------------------------------------------
-# Sound effects (name -> Sound)
+# Sound effects (name -> file, volume); loaded on first use or by preload_sounds()
 # ---------------------------------------------------------------------------
 
-SOUNDS: dict[str, pygame.mixer.Sound | None] = {
-    "hit": load_sound("hit.wav", volume=0.7),
-    "bumper": load_sound("bumper.wav", volume=0.7),
-    "jackpot": load_sound("jackpot.wav", volume=0.7),
+SOUND_FILES: dict[str, tuple[str, float]] = {
+    "hit": ("hit.wav", 0.7),
+    "bumper": ("bumper.wav", 0.7),
+    "jackpot": ("jackpot.wav", 0.7),
 }
 
+_loaded_sounds: dict[str, pygame.mixer.Sound | None] = {}
+# Channels 0/1 carry the ambient loops; each effect gets a small pool of reserved channels
+# after them, so quick retriggers (back-to-back jackpots, bumper rattles) overlap like
+# Sound.play() did without a mixer-wide search for a free channel.
+_MUSIC_CHANNEL_COUNT = 2
+SFX_VOICES_PER_SOUND = 3
+_channel_count = _MUSIC_CHANNEL_COUNT + SFX_VOICES_PER_SOUND * len(SOUND_FILES)
+pygame.mixer.set_num_channels(max(_channel_count, pygame.mixer.get_num_channels()))
+pygame.mixer.set_reserved(_channel_count)
+# name -> that effect's channels, least recently started first.
+_sfx_channels = {
+    name: [
+        pygame.mixer.Channel(_MUSIC_CHANNEL_COUNT + i * SFX_VOICES_PER_SOUND + voice)
+        for voice in range(SFX_VOICES_PER_SOUND)
+    ]
+    for i, name in enumerate(SOUND_FILES)
+}
+_sound_lock = threading.Lock()
+
+
+def get_sound(name: str) -> pygame.mixer.Sound | None:
+    """Return the Sound for name, loading it on first use. None if unknown or it failed to load."""
+    with _sound_lock:
+        if name not in _loaded_sounds:
+            entry = SOUND_FILES.get(name)
+            _loaded_sounds[name] = load_sound(*entry) if entry else None
+        return _loaded_sounds[name]
+
+
+def preload_sounds() -> None:
+    """Load all sound effects on a background thread so the first hit never waits on disk."""
+    threading.Thread(
+        target=lambda: [get_sound(name) for name in SOUND_FILES],
+        daemon=True,
+    ).start()
+
 
 def play_sound(name: str) -> None:
-    """Play a loaded sound by name. No-op if name unknown or sound failed to load."""
-    sound = SOUNDS.get(name)
+    """Play a sound by name. No-op if name unknown or sound failed to load."""
+    sound = get_sound(name)
     if sound:
-        sound.play()
+        channels = _sfx_channels[name]
+        # First idle voice, else steal the one that started longest ago.
+        channel = next((c for c in channels if not c.get_busy()), channels[0])
+        channels.remove(channel)
+        channels.append(channel)
+        channel.play(sound)
 
 
 # ---------------------------------------------------------------------------
 # Ambient music
 # ---------------------------------------------------------------------------
 
-crowd_loop = load_sound("hockey_theme.wav", volume=0.6)
-organ_loop = load_sound("hockey_theme1.wav", volume=0.3)
+CROWD_LOOP_FILE = ("hockey_theme.wav", 0.6)
+ORGAN_LOOP_FILE = ("hockey_theme1.wav", 0.3)
+crowd_loop: pygame.mixer.Sound | None = None
+organ_loop: pygame.mixer.Sound | None = None
 crowd_channel = pygame.mixer.Channel(0)
 organ_channel = pygame.mixer.Channel(1)
 music_on = True
 
 
-def start_music() -> None:
-    """Start crowd and organ loops. Safe to call if files failed to load."""
+def _load_and_play_music() -> None:
+    global crowd_loop, organ_loop
+    if crowd_loop is None:
+        crowd_loop = load_sound(*CROWD_LOOP_FILE)
+    if organ_loop is None:
+        organ_loop = load_sound(*ORGAN_LOOP_FILE)
     if crowd_loop:
         crowd_channel.play(crowd_loop, loops=-1)
     if organ_loop:
         organ_channel.play(organ_loop, loops=-1)
+    if not music_on:
+        crowd_channel.pause()
+        organ_channel.pause()
+
+
+def start_music() -> None:
+    """Start crowd and organ loops. Safe to call if files failed to load.
+
+    The loop files are large, so they load on a background thread and start playing
+    once decoded instead of holding up the attract screen.
+    """
+    threading.Thread(target=_load_and_play_music, daemon=True).start()
 
 
 def toggle_music() -> None:
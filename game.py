@@ -2,14 +2,16 @@
 """Attract mode, gameplay, high score, and hardware polling. Test/diagnostics live in test_mode.py."""
 
 import os
+import queue
 import sys
 import time
 import threading
 from enum import Enum, auto
+import numpy as np
 import pygame
 
 from assets import load_font, load_image
-from audio import play_sound, start_music
+from audio import play_sound, preload_sounds, start_music
 from hardware import (
     DROP_TARGET_COL_SETTLE_S,
     DROP_TARGET_PRESSED_WHEN_DOWN,
@@ -26,6 +28,7 @@ from hardware import (
     jackpot_gate,
     popper_gate,
     pulse_solenoid,
+    queue_pulse,
     start_button,
     target1,
     target2,
@@ -40,11 +43,15 @@ from test_mode import TestModeContext, run_test_mode
 # ============================================================
 
 HIGH_SCORE_FILE = "pinball_highscore.txt"
+# A new record is written to disk at most this often during play (always on game over / exit).
+HIGH_SCORE_SAVE_INTERVAL_S = 5.0
 
 # Display (fallback; actual size set from display after pygame.init)
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
+# Attract / game-over screens are mostly static; poll input at a lower rate there.
+IDLE_FPS = 30
 
 # Jumbotron layout
 JUMBO_SCALE = (800, 600)
@@ -55,6 +62,26 @@ CUTOUT_OFFSET_Y = 60
 # Gameplay HUD in the side margins (drawn on the full-screen rink).
 HUD_ICE_GOLD = (185, 125, 0)
 
+# Dot-matrix text (score / PIONEER bulbs)
+DOT_FONT_SIZE = 48
+DOT_RADIUS = 2
+# Animated scales (score pop, PIONEER flash) are snapped to 1/N steps so the glyph cache stays small.
+DOT_SCALE_STEPS = 20
+DOT_SPACING = 3
+SCORE_SCALE = 3
+SCORE_COLOR = (255, 255, 255)
+PIONEER_SCALE = 2
+PIONEER_PITCH = 70
+PIONEER_LIT_COLOR = (255, 215, 60)
+PIONEER_DIM_COLOR = (120, 120, 60)
+PIONEER_DIM_GLYPH = "•"
+MEGA_JACKPOT_TEXT = "MEGA JACKPOT!!"
+MEGA_JACKPOT_COLOR = (255, 215, 0)
+# Width of the startup glyph atlas; the shelf packer wraps rows at this width.
+ATLAS_WIDTH = 1024
+# Max entries per render cache (dot glyphs, score, PIONEER row, HUD text); oldest evicted first.
+SURFACE_CACHE_MAX = 64
+
 # Scoring
 POINTS_TARGET_HIT = 100
 POINTS_BUMPER = 500
@@ -75,7 +102,8 @@ JACKPOT_RESET_COOLDOWN = 0.75
 DROP_TARGET_RESET_AFTER_GOAL_S = 10.0
 POPPER_PULSE_TIME = 0.8
 BLINK_INTERVAL_MS = 500
-FADE_STEP_START = 6
+# Start-screen fade to black, timed so its length doesn't depend on the frame rate.
+START_FADE_MS = 500
 FADE_STEP_GAME_OVER = 5
 SCORE_POP_DURATION = 0.2
 PIONEER_FLASH_DURATION = 0.4
@@ -107,20 +135,35 @@ def load_high_score() -> int:
 
 
 def save_high_score(score_value: int) -> None:
-    """Save high score to file (ignore errors so game keeps running)."""
+    """Save high score to file atomically (ignore errors so game keeps running)."""
+    tmp_path = HIGH_SCORE_FILE + ".tmp"
     try:
-        with open(HIGH_SCORE_FILE, "w") as f:
+        with open(tmp_path, "w") as f:
             f.write(str(score_value))
+        os.replace(tmp_path, HIGH_SCORE_FILE)
     except OSError:
         pass
 
 
 def update_high_score() -> None:
-    """Update global high_score based on current score."""
-    global score, high_score
+    """Update global high_score based on current score; the file write is deferred (see flush_high_score)."""
+    global score, high_score, high_score_dirty
     if score > high_score:
         high_score = score
-        save_high_score(high_score)
+        high_score_dirty = True
+
+
+def flush_high_score(force: bool = False) -> None:
+    """Write a changed high score, at most every HIGH_SCORE_SAVE_INTERVAL_S unless force."""
+    global high_score_dirty, last_high_score_save_mono
+    if not high_score_dirty:
+        return
+    now_mono = time.monotonic()
+    if not force and now_mono - last_high_score_save_mono < HIGH_SCORE_SAVE_INTERVAL_S:
+        return
+    save_high_score(high_score)
+    high_score_dirty = False
+    last_high_score_save_mono = now_mono
 
 
 # ============================================================
@@ -132,8 +175,23 @@ pygame.init()
 _info = pygame.display.Info()
 SCREEN_WIDTH = _info.current_w
 SCREEN_HEIGHT = _info.current_h
+# Plain software window: display.update(rects) only pushes the dirty rects. SCALED would add a
+# renderer that presents the whole frame on every update. Surfaces below use the display format.
 SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("SHU PIONEER ARENA")
+# Every loop (gameplay, attract, game over, test mode) only reads QUIT and KEYDOWN;
+# keep mouse/touch motion and key-up spam out of the event queue. Window events are
+# rare (focus, expose), so they are left allowed rather than listed here.
+pygame.event.set_blocked([
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEWHEEL,
+    pygame.FINGERMOTION,
+    pygame.FINGERDOWN,
+    pygame.FINGERUP,
+    pygame.KEYUP,
+])
 
 # Images
 rink_img = load_image("icerink.png", scale=(SCREEN_WIDTH, SCREEN_HEIGHT), background=(255, 255, 255))
@@ -143,10 +201,32 @@ jumbo_y = JUMBO_TOP
 cutout_x = jumbo_x + (jumbo_img.get_width() - CUTOUT_WIDTH) // 2
 cutout_y = jumbo_y + CUTOUT_OFFSET_Y
 cutout_rect = pygame.Rect(cutout_x, cutout_y, CUTOUT_WIDTH, CUTOUT_HEIGHT)
+# Rink + jumbotron never change: composite once so each frame is a single opaque blit.
+background_img = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+background_img.blit(rink_img, (0, 0))
+background_img.blit(jumbo_img, (jumbo_x, jumbo_y))
+background_img = background_img.convert()
+# Full-screen MEGA JACKPOT flash; only its alpha changes per frame.
+mega_jackpot_flash_img = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+mega_jackpot_flash_img.fill((206, 17, 65))
+# Black overlay for the start / game-over fades; callers set its alpha per step.
+fade_img = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+fade_img.fill((0, 0, 0))
+# Debug grid over the jumbotron cutout, drawn once; one pixel larger because the
+# grid lines end on the cutout's right/bottom edge.
+debug_grid_img = pygame.Surface((CUTOUT_WIDTH + 1, CUTOUT_HEIGHT + 1), pygame.SRCALPHA)
+pygame.draw.rect(debug_grid_img, (255, 0, 0), (0, 0, CUTOUT_WIDTH, CUTOUT_HEIGHT), 2)
+for _gx in range(0, CUTOUT_WIDTH, CUTOUT_WIDTH // 10):
+    pygame.draw.line(debug_grid_img, (255, 0, 0), (_gx, 0), (_gx, CUTOUT_HEIGHT), 1)
+for _gy in range(0, CUTOUT_HEIGHT, CUTOUT_HEIGHT // 5):
+    pygame.draw.line(debug_grid_img, (255, 0, 0), (0, _gy), (CUTOUT_WIDTH, _gy), 1)
+debug_grid_img = debug_grid_img.convert_alpha()
 
 # Fonts
 small_font = load_font(28, bold=True)
 medium_font = load_font(48, bold=True)
+# Source font for dot-matrix glyphs (shared via load_font's cache).
+_DOT_FONT = load_font(DOT_FONT_SIZE, bold=True)
 
 clock = pygame.time.Clock()
 
@@ -167,13 +247,18 @@ current_mode: SystemMode = SystemMode.ATTRACT_MODE
 
 score: int = 0
 high_score: int = load_high_score()
+# New record not yet written to HIGH_SCORE_FILE (see flush_high_score).
+high_score_dirty: bool = False
+last_high_score_save_mono: float = 0.0
 balls_left: int = INITIAL_BALLS
 collected: int = 0  # PIONEER progress (0–len(PIONEER_LETTERS))
 mega_jackpot: bool = False
 debug_mode: bool = False
 
-# Drop target state: index = physical target; False = up, True = down (same sense as test mode UP/DOWN).
-drop_targets_down = [False, False, False]
+# Drop target state: index = physical target (order of DROP_TARGETS); False = up, True = down
+# (same sense as test mode UP/DOWN).
+DROP_TARGETS = (target1, target2, target3)
+drop_targets_down = [False] * len(DROP_TARGETS)
 # Previous poll: all three were down (for debug / overlay).
 drop_target_prev_all_down: bool = False
 last_jackpot_reset_pulse_mono: float = 0.0
@@ -184,8 +269,9 @@ drop_target_reset_due_mono: float | None = None
 last_hit: float = 0.0
 last_bumper_hit: dict = {1: 0.0, 2: 0.0}
 
-# Track previous state of the drain switch to detect edges
-ball_drain_last_state: bool = False
+# GPIO edges: gpiozero callback threads queue handlers here; the main loop runs them
+# (see dispatch_hardware_events) so game state is only mutated on one thread.
+_gpio_events: queue.SimpleQueue = queue.SimpleQueue()
 
 # Goal: edge detect + cooldown (stuck/bouncy switches); dwell timing for popper (see GOAL_POPPER_HOLD_S).
 goal_sensor_last_state: bool = False
@@ -196,25 +282,143 @@ goal_popper_fired_this_hold: bool = False
 # For uptime / status display
 program_start_time = time.time()
 
-# Keyboard test (attract/gameplay): strike test on Return edge, no blocking wait.
-keyboard_return_was_down: bool = False
-
 # Animation state
 score_pop_until: float = 0.0
 pioneer_flash_index: int = -1
 pioneer_flash_until: float = 0.0
 mega_jackpot_until: float = 0.0
 
+# Dirty-rect rendering: screen regions drawn by the previous draw_layout (restored from
+# background_img next frame) and the rects to present this frame (cleared by render_frame).
+layout_prev_rects: list[pygame.Rect] = []
+dirty_rects: list[pygame.Rect] = []
+# Set when another screen has painted over the layout; next draw_layout repaints everything.
+layout_needs_full_redraw: bool = True
+# layout_state() as of the last drawn frame; render_frame skips drawing while it is unchanged.
+last_layout_state: tuple | None = None
+
 
 # ============================================================
 # RENDER HELPERS
 # ============================================================
 
 
-def _blit_centered(surface: pygame.Surface, source: pygame.Surface, y: int) -> None:
-    """Blit source onto surface horizontally centered at the given y."""
+def _blit_centered(surface: pygame.Surface, source: pygame.Surface, y: int) -> pygame.Rect:
+    """Blit source onto surface horizontally centered at the given y; returns the blitted rect."""
     x = SCREEN_WIDTH // 2 - source.get_width() // 2
-    surface.blit(source, (x, y))
+    return surface.blit(source, (x, y))
+
+
+def _cache_store(cache: dict, key, surf: pygame.Surface) -> pygame.Surface:
+    """Insert surf into a render cache, evicting the oldest entry (FIFO) when full."""
+    if len(cache) >= SURFACE_CACHE_MAX:
+        del cache[next(iter(cache))]
+    surf = surf.convert_alpha()
+    cache[key] = surf
+    return surf
+
+
+# (text, scale, spacing, color) -> pre-rendered dot-matrix text, padded by DOT_RADIUS on each side.
+# Entries outside the atlas (e.g. the flashing PIONEER letter) go here and are FIFO-bounded.
+_DOT_GLYPH_CACHE: dict[tuple, pygame.Surface] = {}
+# (score, scale, color) -> dot-matrix score surface; the score only changes on hits.
+_score_surface_cache: dict[tuple, pygame.Surface] = {}
+# (collected, blank_index) -> composed PIONEER row.
+_pioneer_surface_cache: dict[tuple, pygame.Surface] = {}
+# Int value -> rendered HUD label.
+_high_score_surface_cache: dict[int, pygame.Surface] = {}
+_balls_surface_cache: dict[int, pygame.Surface] = {}
+
+
+def _snap_dot_scale(scale: float) -> float:
+    return round(scale * DOT_SCALE_STEPS) / DOT_SCALE_STEPS
+
+
+def _dot_kernel_offsets() -> tuple[np.ndarray, np.ndarray]:
+    """Pixel offsets from a dot's centre that pygame.draw.circle fills at DOT_RADIUS."""
+    size = 2 * DOT_RADIUS + 1
+    sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, (255, 255, 255), (DOT_RADIUS, DOT_RADIUS), DOT_RADIUS)
+    dx, dy = np.nonzero(pygame.surfarray.array_alpha(sprite))
+    return dx - DOT_RADIUS, dy - DOT_RADIUS
+
+
+_DOT_KERNEL = _dot_kernel_offsets()
+
+
+def _render_dot_glyph(text: str, scale: float, spacing: int, color: tuple) -> pygame.Surface:
+    """Rasterize text as dot-matrix bulbs onto a transparent surface."""
+    base = _DOT_FONT.render(text, True, (255, 255, 255))
+    w, h = int(base.get_width() * scale), int(base.get_height() * scale)
+    base = pygame.transform.scale(base, (w, h))
+    # Sample the glyph's alpha on the dot grid in one step (same >127 cutoff as mask.from_surface).
+    lit = pygame.surfarray.array_alpha(base)[::spacing, ::spacing] > 127
+    xs, ys = np.nonzero(lit)
+    cx = xs * spacing + DOT_RADIUS
+    cy = ys * spacing + DOT_RADIUS
+
+    # Stamp every bulb at once: one vectorized write per kernel pixel, none per dot.
+    glyph = pygame.Surface((w + 2 * DOT_RADIUS, h + 2 * DOT_RADIUS), pygame.SRCALPHA)
+    glyph.fill((*color, 0))
+    alpha = pygame.surfarray.pixels_alpha(glyph)
+    for dx, dy in zip(*_DOT_KERNEL):
+        alpha[cx + dx, cy + dy] = 255
+    del alpha  # release the pixel lock
+    return glyph
+
+
+def _get_dot_glyph(text: str, scale: float, spacing: int, color: tuple) -> pygame.Surface:
+    key = (text, scale, spacing, color)
+    glyph = _ATLAS_GLYPHS.get(key)
+    if glyph is None:
+        glyph = _DOT_GLYPH_CACHE.get(key)
+    if glyph is None:
+        glyph = _cache_store(_DOT_GLYPH_CACHE, key, _render_dot_glyph(*key))
+    return glyph
+
+
+# One surface holding every fixed glyph/label (PIONEER lit + dim, MEGA JACKPOT!!),
+# with its source rect per key; built once by _build_atlas().
+_ATLAS: pygame.Surface
+_ATLAS_UV: dict = {}
+# Dot-matrix atlas entries as subsurfaces, kept apart from _DOT_GLYPH_CACHE so they are never evicted.
+_ATLAS_GLYPHS: dict[tuple, pygame.Surface] = {}
+
+
+def _build_atlas() -> None:
+    """Pack the fixed glyphs and labels into _ATLAS with a simple shelf packer.
+
+    Dot-matrix entries are also put in _ATLAS_GLYPHS as atlas subsurfaces, so
+    draw_dot_text and the composed-surface caches read them from the atlas.
+    """
+    global _ATLAS
+    glyph_keys = [
+        (ch, float(PIONEER_SCALE), DOT_SPACING, PIONEER_LIT_COLOR) for ch in dict.fromkeys(PIONEER_LETTERS)
+    ]
+    glyph_keys.append((PIONEER_DIM_GLYPH, float(PIONEER_SCALE), DOT_SPACING, PIONEER_DIM_COLOR))
+    entries = [(key, _render_dot_glyph(*key)) for key in glyph_keys]
+    entries.append((MEGA_JACKPOT_TEXT, medium_font.render(MEGA_JACKPOT_TEXT, True, MEGA_JACKPOT_COLOR)))
+
+    # Shelf packing: tallest first, left to right, new shelf when the row is full.
+    entries.sort(key=lambda entry: entry[1].get_height(), reverse=True)
+    x = y = shelf_h = 0
+    for key, surf in entries:
+        w, h = surf.get_size()
+        if x + w > ATLAS_WIDTH:
+            x, y, shelf_h = 0, y + shelf_h, 0
+        _ATLAS_UV[key] = pygame.Rect(x, y, w, h)
+        x += w
+        shelf_h = max(shelf_h, h)
+
+    _ATLAS = pygame.Surface((ATLAS_WIDTH, y + shelf_h), pygame.SRCALPHA).convert_alpha()
+    _ATLAS.fill((0, 0, 0, 0))
+    for key, surf in entries:
+        _ATLAS.blit(surf, _ATLAS_UV[key])
+        if key in glyph_keys:
+            _ATLAS_GLYPHS[key] = _ATLAS.subsurface(_ATLAS_UV[key])
+
+
+_build_atlas()
 
 
 def draw_dot_text(
@@ -225,22 +429,67 @@ def draw_dot_text(
     color: tuple = (255, 255, 255),
     scale: float = 2,
     spacing: int = 3,
-) -> None:
-    """Render text as a dot-matrix style using a mask."""
-    font = pygame.font.SysFont("Courier New", 48, bold=True)
-    base = font.render(text, True, (255, 255, 255))
-    w, h = int(base.get_width() * scale), int(base.get_height() * scale)
-    base = pygame.transform.scale(base, (w, h))
-    mask = pygame.mask.from_surface(base)
+) -> pygame.Rect:
+    """Render text as a dot-matrix style by blitting its cached rasterization; returns the drawn rect."""
+    glyph = _get_dot_glyph(text, _snap_dot_scale(scale), spacing, color)
+    return surface.blit(glyph, (x - DOT_RADIUS, y - DOT_RADIUS))
+
+
+def _get_score_surface(n: int, scale: float, color: tuple) -> pygame.Surface:
+    """Whole score as one dot-matrix surface (padded by DOT_RADIUS), rasterized on first use.
+
+    The full string is rendered and sampled in one go, so kerning and the dot-grid phase
+    match the font rather than restarting at every digit.
+    """
+    scale = _snap_dot_scale(scale)
+    key = (n, scale, color)
+    surf = _score_surface_cache.get(key)
+    if surf is None:
+        surf = _cache_store(_score_surface_cache, key, _render_dot_glyph(str(n), scale, DOT_SPACING, color))
+    return surf
+
+
+def _get_pioneer_surface(collected_count: int, blank_index: int = -1) -> pygame.Surface:
+    """Steady-state PIONEER row (lit letters + dim dots); blank_index leaves a slot empty for the flash."""
+    key = (collected_count, blank_index)
+    surf = _pioneer_surface_cache.get(key)
+    if surf is None:
+        slots = []
+        for i, letter in enumerate(PIONEER_LETTERS):
+            if i == blank_index:
+                continue
+            if i < collected_count:
+                slots.append((i, letter, PIONEER_LIT_COLOR))
+            else:
+                # Dim placeholder dot
+                slots.append((i, PIONEER_DIM_GLYPH, PIONEER_DIM_COLOR))
+        glyphs = [(i, _get_dot_glyph(ch, PIONEER_SCALE, DOT_SPACING, color)) for i, ch, color in slots]
+        width = max((i * PIONEER_PITCH + g.get_width() for i, g in glyphs), default=1)
+        height = max((g.get_height() for _, g in glyphs), default=1)
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        for i, glyph in glyphs:
+            surf.blit(glyph, (i * PIONEER_PITCH, 0))
+        surf = _cache_store(_pioneer_surface_cache, key, surf)
+    return surf
+
+
+def _prerender_pioneer_rows() -> None:
+    """Build every PIONEER row gameplay can show (steady, and with the just-lit slot blank) up front."""
+    for n in range(len(PIONEER_LETTERS) + 1):
+        _get_pioneer_surface(n)
+        if n:
+            _get_pioneer_surface(n, n - 1)
+
+
+_prerender_pioneer_rows()
 
-    for px in range(mask.get_size()[0]):
-        for py in range(mask.get_size()[1]):
-            if (
-                mask.get_at((px, py))
-                and (px % spacing == 0)
-                and (py % spacing == 0)
-            ):
-                pygame.draw.circle(surface, color, (x + px, y + py), 2)
+
+def _get_hud_surface(cache: dict, value: int, fmt: str, color: tuple) -> pygame.Surface:
+    """Small-font HUD label for an int value, rendered once per distinct value."""
+    surf = cache.get(value)
+    if surf is None:
+        surf = _cache_store(cache, value, small_font.render(fmt.format(value), True, color))
+    return surf
 
 
 def draw_pioneer(
@@ -250,78 +499,89 @@ def draw_pioneer(
     collected_count: int,
     flash_index: int = -1,
     flash_until: float = 0.0,
-) -> None:
-    """Draw PIONEER letters as bulbs on the jumbotron. Optional flash for recently lit letter."""
+) -> pygame.Rect:
+    """Draw PIONEER letters as bulbs on the jumbotron. Optional flash for recently lit letter.
+
+    Returns the rect covering everything drawn.
+    """
     now = time.time()
-    for i, letter in enumerate(PIONEER_LETTERS):
-        if i < collected_count:
-            if i == flash_index and now < flash_until:
-                # Just lit: brighter and slightly larger
-                progress = 1.0 - (flash_until - now) / PIONEER_FLASH_DURATION
-                scale = 2.0 + 0.3 * (1.0 - progress)
-                color = (255, 255, 200)
-            else:
-                scale = 2
-                color = (255, 215, 60)
-            draw_dot_text(surface, letter, x + i * 70, y, color, scale=scale)
-        else:
-            # Dim placeholder dot
-            draw_dot_text(surface, "•", x + i * 70, y, (120, 120, 60), scale=2)
+    flashing = 0 <= flash_index < collected_count and now < flash_until
+    row = _get_pioneer_surface(collected_count, flash_index if flashing else -1)
+    drawn = surface.blit(row, (x - DOT_RADIUS, y - DOT_RADIUS))
+    if flashing:
+        # Just lit: brighter and slightly larger
+        progress = 1.0 - (flash_until - now) / PIONEER_FLASH_DURATION
+        scale = 2.0 + 0.3 * (1.0 - progress)
+        drawn.union_ip(
+            draw_dot_text(
+                surface,
+                PIONEER_LETTERS[flash_index],
+                x + flash_index * PIONEER_PITCH,
+                y,
+                (255, 255, 200),
+                scale=scale,
+            )
+        )
+    return drawn
 
 
 def draw_layout() -> None:
-    """Draw the full rink, jumbotron, score, PIONEER progress, and HUD."""
-    SCREEN.blit(rink_img, (0, 0))
-    SCREEN.blit(jumbo_img, (jumbo_x, jumbo_y))
+    """Draw the full rink, jumbotron, score, PIONEER progress, and HUD.
+
+    Only the regions touched last frame are restored from background_img; everything
+    repainted is appended to dirty_rects for pygame.display.update().
+    """
+    global layout_needs_full_redraw
+    if layout_needs_full_redraw:
+        SCREEN.blit(background_img, (0, 0))
+        dirty_rects.append(SCREEN.get_rect())
+        layout_needs_full_redraw = False
+    else:
+        SCREEN.blits([(background_img, rect, rect) for rect in layout_prev_rects], doreturn=False)
+        dirty_rects.extend(layout_prev_rects)
+    drawn: list[pygame.Rect] = []
 
     # Score with optional pop animation
     now = time.time()
     score_scale_mult = 1.0
-    score_color = (255, 255, 255)
+    score_color = SCORE_COLOR
     if now < score_pop_until:
         elapsed = score_pop_until - now
         score_scale_mult = 1.0 + 0.25 * min(1.0, elapsed / SCORE_POP_DURATION)
         score_color = (255, 255, 220)
-    score_text = str(score)
-    font = pygame.font.SysFont("Courier New", 48, bold=True)
-    base = font.render(score_text, True, (255, 255, 255))
-    text_width = int(base.get_width() * 3 * score_scale_mult)
-    draw_dot_text(
-        SCREEN,
-        score_text,
-        cutout_rect.centerx - text_width // 2,
-        cutout_rect.y + 200,
-        score_color,
-        scale=3 * score_scale_mult,
-    )
-
-    hs_surface = small_font.render(f"HIGH SCORE: {high_score}", True, HUD_ICE_GOLD)
-    SCREEN.blit(hs_surface, (SCREEN_WIDTH - hs_surface.get_width() - 20, 20))
-
-    draw_pioneer(
+    score_surface = _get_score_surface(score, SCORE_SCALE * score_scale_mult, score_color)
+    hs_surface = _get_hud_surface(_high_score_surface_cache, high_score, "HIGH SCORE: {}", HUD_ICE_GOLD)
+    balls_surface = _get_hud_surface(_balls_surface_cache, balls_left, "Balls: {}", (0, 0, 0))
+    balls_y = SCREEN_HEIGHT - 50 - int(SCREEN_HEIGHT * 0.1)
+    # The cached HUD surfaces don't overlap, so draw them in one blits() call.
+    drawn.extend(SCREEN.blits([
+        (score_surface, (cutout_rect.centerx - score_surface.get_width() // 2, cutout_rect.y + 200 - DOT_RADIUS)),
+        (hs_surface, (SCREEN_WIDTH - hs_surface.get_width() - 20, 20)),
+        (balls_surface, (40, balls_y)),
+    ]))
+
+    drawn.append(draw_pioneer(
         SCREEN,
         cutout_rect.x,
         cutout_rect.y + cutout_rect.height + 258,
         collected,
         pioneer_flash_index,
         pioneer_flash_until,
-    )
-
-    balls_surface = small_font.render(f"Balls: {balls_left}", True, (0, 0, 0))
-    balls_y = SCREEN_HEIGHT - 50 - int(SCREEN_HEIGHT * 0.1)
-    SCREEN.blit(balls_surface, (40, balls_y))
+    ))
 
     # MEGA JACKPOT: flash overlay then text
     if mega_jackpot and mega_jackpot_until > 0:
         mj_elapsed = time.time() - (mega_jackpot_until - MEGA_JACKPOT_DURATION)
         if mj_elapsed < MEGA_JACKPOT_FLASH_DURATION:
-            flash_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            flash_surf.fill((206, 17, 65))
             alpha = int(180 * (1.0 - mj_elapsed / MEGA_JACKPOT_FLASH_DURATION))
-            flash_surf.set_alpha(alpha)
-            SCREEN.blit(flash_surf, (0, 0))
-        mj = medium_font.render("MEGA JACKPOT!!", True, (255, 215, 0))
-        _blit_centered(SCREEN, mj, SCREEN_HEIGHT - 80)
+            mega_jackpot_flash_img.set_alpha(alpha)
+            drawn.append(SCREEN.blit(mega_jackpot_flash_img, (0, 0)))
+        mj_area = _ATLAS_UV[MEGA_JACKPOT_TEXT]
+        drawn.append(SCREEN.blit(
+            _ATLAS,
+            (SCREEN_WIDTH // 2 - mj_area.width // 2, SCREEN_HEIGHT - 80),
+            mj_area,
+        ))
 
     # Debug overlay (jumbotron grid)
     if debug_mode:
@@ -332,24 +592,11 @@ def draw_layout() -> None:
                 True,
                 (0, 255, 128),
             )
-            SCREEN.blit(dt_dbg, (10, 70))
-        pygame.draw.rect(SCREEN, (255, 0, 0), cutout_rect, 2)
-        step_x = cutout_rect.width // 10
-        step_y = cutout_rect.height // 5
-        for gx in range(cutout_rect.x, cutout_rect.right, step_x):
-            pygame.draw.line(
-                SCREEN, (255, 0, 0),
-                (gx, cutout_rect.y),
-                (gx, cutout_rect.bottom),
-                1,
-            )
-        for gy in range(cutout_rect.y, cutout_rect.bottom, step_y):
-            pygame.draw.line(
-                SCREEN, (255, 0, 0),
-                (cutout_rect.x, gy),
-                (cutout_rect.right, gy),
-                1,
-            )
+            drawn.append(SCREEN.blit(dt_dbg, (10, 70)))
+        drawn.append(SCREEN.blit(debug_grid_img, cutout_rect.topleft))
+
+    layout_prev_rects[:] = drawn
+    dirty_rects.extend(drawn)
 
 
 # ============================================================
@@ -380,11 +627,7 @@ def on_bumper_hit(bumper_id: int) -> None:
         score_pop_until = now + SCORE_POP_DURATION
         play_sound("bumper")
         gate = gate1 if bumper_id == 1 else gate2
-        threading.Thread(
-            target=pulse_solenoid,
-            args=(gate, SOLENOID_PULSE_TIME),
-            daemon=True,
-        ).start()
+        queue_pulse(gate, SOLENOID_PULSE_TIME)
 
 
 def on_goal_scored() -> None:
@@ -426,12 +669,9 @@ def trigger_drop_target_reset(source: str) -> bool:
             print(f"[drop_target] RESET skipped (cooldown) source={source!r} wait ~{remain:.2f}s")
         return False
     last_jackpot_reset_pulse_mono = now_mono
-    print(f"[drop_target] RESET FIRE source={source!r}")
-    threading.Thread(
-        target=pulse_solenoid,
-        args=(jackpot_gate, JACKPOT_GATE_PULSE_TIME),
-        daemon=True,
-    ).start()
+    if debug_mode:
+        print(f"[drop_target] RESET FIRE source={source!r}")
+    queue_pulse(jackpot_gate, JACKPOT_GATE_PULSE_TIME)
     return True
 
 
@@ -441,9 +681,8 @@ def on_drop_target_hit() -> None:
 
     was_all = drop_target_prev_all_down
     # Same normalization as SWITCH TEST: pressed -> UP, not pressed -> DOWN (see DROP_TARGET_PRESSED_WHEN_DOWN).
-    raw_pressed = [target1.is_pressed, target2.is_pressed, target3.is_pressed]
-    for i, p in enumerate(raw_pressed):
-        drop_targets_down[i] = p if DROP_TARGET_PRESSED_WHEN_DOWN else not p
+    raw_pressed = [target.is_pressed for target in DROP_TARGETS]
+    drop_targets_down[:] = [p == DROP_TARGET_PRESSED_WHEN_DOWN for p in raw_pressed]
 
     all_down = all(drop_targets_down)
     if debug_mode:
@@ -497,9 +736,8 @@ def sync_drop_targets_after_reset() -> None:
     if DROP_TARGET_USE_COL_FOR_READ:
         col.on()
         time.sleep(DROP_TARGET_COL_SETTLE_S)
-    raw_pressed = [target1.is_pressed, target2.is_pressed, target3.is_pressed]
-    for i, p in enumerate(raw_pressed):
-        drop_targets_down[i] = p if DROP_TARGET_PRESSED_WHEN_DOWN else not p
+    raw_pressed = [target.is_pressed for target in DROP_TARGETS]
+    drop_targets_down[:] = [p == DROP_TARGET_PRESSED_WHEN_DOWN for p in raw_pressed]
     if DROP_TARGET_USE_COL_FOR_READ:
         col.off()
     drop_target_prev_all_down = all(drop_targets_down)
@@ -521,156 +759,186 @@ def check_pending_drop_target_reset() -> None:
     sync_drop_targets_after_reset()
 
 
-def poll_hardware_inputs() -> None:
-    """Read GPIO inputs and dispatch to game handlers."""
-    global ball_drain_last_state, goal_sensor_last_state, last_goal_time
+def on_goal_sensor_pressed() -> None:
+    """Goal switch closed: score (cooldown guards sticky/bouncy switches) and start popper dwell."""
+    global goal_sensor_last_state, last_goal_time, goal_dwell_start_mono, goal_popper_fired_this_hold
+    goal_sensor_last_state = True
+    goal_dwell_start_mono = time.monotonic()
+    goal_popper_fired_this_hold = False
+    now = time.time()
+    if now - last_goal_time >= GOAL_COOLDOWN:
+        on_goal_scored()
+        last_goal_time = now
+
+
+def on_goal_sensor_released() -> None:
+    """Goal switch opened: ball left the pocket, disarm the popper."""
+    global goal_sensor_last_state, goal_dwell_start_mono, goal_popper_fired_this_hold
+    goal_sensor_last_state = False
+    goal_dwell_start_mono = None
+    goal_popper_fired_this_hold = False
+
+
+def check_goal_popper() -> None:
+    """Fire the popper once the goal switch has been held for GOAL_POPPER_HOLD_S (ball in pocket)."""
     global goal_dwell_start_mono, goal_popper_fired_this_hold
+    # Follow the switch level as well as the edges, so an edge lost to bounce_time
+    # (or a ball already in the pocket at boot) cannot leave the popper stuck.
+    if not goal_sensor.is_pressed:
+        on_goal_sensor_released()
+        return
+    if goal_dwell_start_mono is None:
+        goal_dwell_start_mono = time.monotonic()
+        return
+    if goal_popper_fired_this_hold:
+        return
+    if time.monotonic() - goal_dwell_start_mono < GOAL_POPPER_HOLD_S:
+        return
+    goal_popper_fired_this_hold = True
+    queue_pulse(popper_gate, POPPER_PULSE_TIME)
+
 
+def bind_hardware_callbacks() -> None:
+    """Wire gpiozero edge callbacks to queue game handlers for dispatch_hardware_events."""
     if not USE_GPIO:
         return
 
-    # Strike plate / bumpers (do not tie to IR column — matches typical wiring)
-    if targets_any.is_pressed:
-        on_target_hit()
+    def queue_handler(handler):
+        return lambda: _gpio_events.put(handler)
 
-    if bumper1.is_pressed:
-        on_bumper_hit(1)
+    # Strike plate / bumpers (do not tie to IR column — matches typical wiring)
+    targets_any.when_pressed = queue_handler(on_target_hit)
+    bumper1.when_pressed = queue_handler(lambda: on_bumper_hit(1))
+    bumper2.when_pressed = queue_handler(lambda: on_bumper_hit(2))
+    # Drop targets: either edge re-reads the bank. With DROP_TARGET_USE_COL_FOR_READ the optos
+    # only read correctly while COL_PIN is on, so dispatch_hardware_events polls them instead.
+    if not DROP_TARGET_USE_COL_FOR_READ:
+        for target in DROP_TARGETS:
+            target.when_pressed = queue_handler(on_drop_target_hit)
+            target.when_released = queue_handler(on_drop_target_hit)
+    goal_sensor.when_pressed = queue_handler(on_goal_sensor_pressed)
+    goal_sensor.when_released = queue_handler(on_goal_sensor_released)
+    # Ball arriving in trough
+    ball_drain.when_pressed = queue_handler(on_ball_drained)
+
+
+def discard_hardware_events() -> None:
+    """Drop GPIO edges queued while gameplay was not running (e.g. during the game-over screen)."""
+    while not _gpio_events.empty():
+        _gpio_events.get_nowait()
+
+
+def dispatch_hardware_events() -> None:
+    """Run handlers for GPIO edges queued since the last frame, then time-based hardware checks."""
+    if not USE_GPIO:
+        return
 
-    if bumper2.is_pressed:
-        on_bumper_hit(2)
+    while not _gpio_events.empty():
+        _gpio_events.get_nowait()()
 
-    # Drop targets: same conditions as test_mode SWITCH TEST (col off unless DROP_TARGET_USE_COL_FOR_READ).
     if DROP_TARGET_USE_COL_FOR_READ:
         col.on()
         time.sleep(DROP_TARGET_COL_SETTLE_S)
-    on_drop_target_hit()
-    if DROP_TARGET_USE_COL_FOR_READ:
+        on_drop_target_hit()
         col.off()
 
-    # Goal: edge (press) + cooldown — avoids runaway scoring on sticky/bouncy switches.
-    # Popper: after the switch has been held closed for GOAL_POPPER_HOLD_S (ball in pocket).
-    current_goal = goal_sensor.is_pressed
-    now = time.time()
-    now_m = time.monotonic()
-    rising_goal = current_goal and not goal_sensor_last_state
-    if rising_goal:
-        goal_dwell_start_mono = now_m
-        goal_popper_fired_this_hold = False
-        if now - last_goal_time >= GOAL_COOLDOWN:
-            on_goal_scored()
-            last_goal_time = now
-    elif current_goal and goal_dwell_start_mono is None:
-        # Fallback: if we ever miss the edge transition, still allow
-        # "held for GOAL_POPPER_HOLD_S" behavior to arm and fire.
-        goal_dwell_start_mono = now_m
-    if not current_goal:
-        goal_dwell_start_mono = None
-        goal_popper_fired_this_hold = False
-    elif (
-        goal_dwell_start_mono is not None
-        and not goal_popper_fired_this_hold
-        and now_m - goal_dwell_start_mono >= GOAL_POPPER_HOLD_S
-    ):
-        goal_popper_fired_this_hold = True
-        threading.Thread(
-            target=pulse_solenoid,
-            args=(popper_gate, POPPER_PULSE_TIME),
-            daemon=True,
-        ).start()
-    goal_sensor_last_state = current_goal
-
-    # --- BALL DRAIN SENSOR ---
-    # Detect a new press (ball arriving in trough)
-    current_drain_pressed = ball_drain.is_pressed
-    if current_drain_pressed and not ball_drain_last_state:
-        on_ball_drained()
-    ball_drain_last_state = current_drain_pressed
+    check_goal_popper()
 
 
 # ============================================================
 # SCREENS (START / GAME OVER)
 # ============================================================
 
+def _fade_out_screen(duration_ms: int) -> None:
+    """Fade whatever is on SCREEN to black over duration_ms, redrawing from a snapshot each frame."""
+    frame = SCREEN.copy()
+    start = pygame.time.get_ticks()
+    while True:
+        elapsed = pygame.time.get_ticks() - start
+        fade_img.set_alpha(min(255, 255 * elapsed // duration_ms))
+        SCREEN.blit(frame, (0, 0))
+        SCREEN.blit(fade_img, (0, 0))
+        pygame.display.flip()
+        if elapsed >= duration_ms:
+            return
+        clock.tick(FPS)
+
+
 def show_start_screen() -> SystemMode:
     """Attract screen. Returns GAMEPLAY_MODE to start game, TEST_MODE if F9 used."""
-    global current_mode
+    global current_mode, layout_needs_full_redraw
     current_mode = SystemMode.ATTRACT_MODE
+    layout_needs_full_redraw = True
     blink = True
-    timer = 0.0
-    fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    fade_surface.fill((0, 0, 0))
     start_button_last_state = False
 
-    while True:
-        SCREEN.blit(rink_img, (0, 0))
-        SCREEN.blit(jumbo_img, (jumbo_x, jumbo_y))
-
-        title = medium_font.render("SHU PIONEER PINBALL", True, (255, 255, 255))
-        _blit_centered(SCREEN, title, 260)
-
-        hs_txt = small_font.render(f"ALL-TIME HIGH SCORE: {high_score}", True, (255, 215, 0))
-        _blit_centered(SCREEN, hs_txt, 300)
-
-        if blink:
-            txt = small_font.render("PRESS ENTER OR START BUTTON", True, (255, 215, 0))
-            _blit_centered(SCREEN, txt, 340)
+    # Static screen: draw it once, then only repaint and present the blinking prompt's rect.
+    title = medium_font.render("SHU PIONEER PINBALL", True, (255, 255, 255))
+    hs_txt = small_font.render(f"ALL-TIME HIGH SCORE: {high_score}", True, (255, 215, 0))
+    prompt = small_font.render("PRESS ENTER OR START BUTTON", True, (255, 215, 0))
+    SCREEN.blit(background_img, (0, 0))
+    _blit_centered(SCREEN, title, 260)
+    _blit_centered(SCREEN, hs_txt, 300)
+    prompt_rect = _blit_centered(SCREEN, prompt, 340)
+    pygame.display.flip()
 
-        timer += clock.get_time()
-        if timer >= BLINK_INTERVAL_MS:
+    # Sleep in event.wait until input or the next blink. The GPIO start button is polled,
+    # so with hardware attached wake at least IDLE_FPS times a second to read it.
+    max_wait_ms = 1000 // IDLE_FPS if USE_GPIO else BLINK_INTERVAL_MS
+    next_blink_ms = pygame.time.get_ticks() + BLINK_INTERVAL_MS
+    while True:
+        now_ms = pygame.time.get_ticks()
+        if now_ms >= next_blink_ms:
             blink = not blink
-            timer = 0.0
-
-        pygame.display.flip()
-        clock.tick(FPS)
+            next_blink_ms = now_ms + BLINK_INTERVAL_MS
+            SCREEN.blit(background_img, prompt_rect, prompt_rect)
+            if blink:
+                SCREEN.blit(prompt, prompt_rect)
+            pygame.display.update(prompt_rect)
 
         if USE_GPIO:
             current_start = start_button.is_pressed
             if current_start and not start_button_last_state:
-                for alpha in range(0, 180, FADE_STEP_START):
-                    fade_surface.set_alpha(alpha)
-                    SCREEN.blit(fade_surface, (0, 0))
-                    pygame.display.flip()
-                    clock.tick(FPS)
+                _fade_out_screen(START_FADE_MS)
                 current_mode = SystemMode.GAMEPLAY_MODE
                 return SystemMode.GAMEPLAY_MODE
             start_button_last_state = current_start
 
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if e.type == pygame.KEYDOWN:
-                if e.key == pygame.K_RETURN:
-                    for alpha in range(0, 180, FADE_STEP_START):
-                        fade_surface.set_alpha(alpha)
-                        SCREEN.blit(fade_surface, (0, 0))
-                        pygame.display.flip()
-                        clock.tick(FPS)
-                    current_mode = SystemMode.GAMEPLAY_MODE
-                    return SystemMode.GAMEPLAY_MODE
-                if e.key == pygame.K_F9:
-                    current_mode = SystemMode.TEST_MODE
-                    return SystemMode.TEST_MODE
+        e = pygame.event.wait(max(1, min(max_wait_ms, next_blink_ms - now_ms)))
+        if e.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
+        if e.type == pygame.KEYDOWN:
+            if e.key == pygame.K_RETURN:
+                _fade_out_screen(START_FADE_MS)
+                current_mode = SystemMode.GAMEPLAY_MODE
+                return SystemMode.GAMEPLAY_MODE
+            if e.key == pygame.K_F9:
+                current_mode = SystemMode.TEST_MODE
+                return SystemMode.TEST_MODE
 
 
 def show_game_over_screen() -> None:
     """Fade in Game Over, show score/high score, wait for Enter to restart."""
-    fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    fade_surface.fill((0, 0, 0))
+    global layout_needs_full_redraw
+    layout_needs_full_redraw = True
+    flush_high_score(force=True)
+
+    # The text layer doesn't change during the fade: compose it once, then only the fade alpha varies.
+    game_over_frame = background_img.copy()
+    text = medium_font.render("GAME OVER", True, (255, 50, 50))
+    _blit_centered(game_over_frame, text, 200)
+    final_txt = small_font.render(f"FINAL SCORE: {score}", True, (255, 255, 255))
+    _blit_centered(game_over_frame, final_txt, 260)
+    hs_txt = small_font.render(f"ALL-TIME HIGH: {high_score}", True, (255, 215, 0))
+    _blit_centered(game_over_frame, hs_txt, 295)
+    prompt = small_font.render("PRESS ENTER OR START BUTTON TO RESTART", True, (255, 255, 255))
+    _blit_centered(game_over_frame, prompt, 340)
 
     for alpha in range(0, 180, FADE_STEP_GAME_OVER):
-        fade_surface.set_alpha(alpha)
-        SCREEN.blit(rink_img, (0, 0))
-        SCREEN.blit(jumbo_img, (jumbo_x, jumbo_y))
-        text = medium_font.render("GAME OVER", True, (255, 50, 50))
-        _blit_centered(SCREEN, text, 200)
-        final_txt = small_font.render(f"FINAL SCORE: {score}", True, (255, 255, 255))
-        _blit_centered(SCREEN, final_txt, 260)
-        hs_txt = small_font.render(f"ALL-TIME HIGH: {high_score}", True, (255, 215, 0))
-        _blit_centered(SCREEN, hs_txt, 295)
-        prompt = small_font.render("PRESS ENTER OR START BUTTON TO RESTART", True, (255, 255, 255))
-        _blit_centered(SCREEN, prompt, 340)
-        SCREEN.blit(fade_surface, (0, 0))
+        fade_img.set_alpha(alpha)
+        SCREEN.blit(game_over_frame, (0, 0))
+        SCREEN.blit(fade_img, (0, 0))
         pygame.display.flip()
         pygame.time.delay(30)
 
@@ -682,14 +950,13 @@ def show_game_over_screen() -> None:
                 return
             start_button_last_state = current_start
 
-        clock.tick(FPS)
-
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if e.type == pygame.KEYDOWN and e.key == pygame.K_RETURN:
-                return
+        # Block until input; with GPIO, wake IDLE_FPS times a second to poll the start button.
+        e = pygame.event.wait(1000 // IDLE_FPS) if USE_GPIO else pygame.event.wait()
+        if e.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
+        if e.type == pygame.KEYDOWN and e.key == pygame.K_RETURN:
+            return
 
 
 def handle_pygame_events() -> bool:
@@ -709,7 +976,7 @@ def handle_pygame_events() -> bool:
             if e.key == pygame.K_SPACE:
                 # Test bumper 2
                 on_bumper_hit(2)
-            elif e.key == pygame.K_t:
+            elif e.key in (pygame.K_t, pygame.K_RETURN):
                 # Test strike plate
                 on_target_hit()
             elif e.key == pygame.K_g:
@@ -751,15 +1018,6 @@ def handle_pygame_events() -> bool:
     return True
 
 
-def handle_keyboard_test_hit() -> None:
-    """Keyboard test: Return edge triggers strike plate hit (no blocking wait)."""
-    global keyboard_return_was_down
-    down = pygame.key.get_pressed()[pygame.K_RETURN]
-    if down and not keyboard_return_was_down:
-        on_target_hit()
-    keyboard_return_was_down = down
-
-
 def check_game_over() -> None:
     """If no balls left, show game over screen then reset game state (keep high score)."""
     global score, balls_left, collected, mega_jackpot
@@ -778,13 +1036,38 @@ def check_game_over() -> None:
         mega_jackpot_until = 0.0
         sync_goal_sensor_edge_after_reset()
         sync_drop_targets_after_reset()
+        discard_hardware_events()
         fire_drop_target_reset("restart")
 
 
+def layout_state() -> tuple | None:
+    """Everything draw_layout depends on, or None while a timed animation is running."""
+    now = time.time()
+    mj_flash_until = mega_jackpot_until - MEGA_JACKPOT_DURATION + MEGA_JACKPOT_FLASH_DURATION
+    if now < score_pop_until or now < pioneer_flash_until or (mega_jackpot and now < mj_flash_until):
+        return None
+    return (
+        score,
+        high_score,
+        balls_left,
+        collected,
+        mega_jackpot,
+        debug_mode,
+        tuple(drop_targets_down),
+        drop_target_prev_all_down,
+    )
+
+
 def render_frame() -> None:
-    """Draw current frame and tick clock."""
-    draw_layout()
-    pygame.display.flip()
+    """Draw and present the frame if anything on it changed, then tick clock."""
+    global last_layout_state
+    state = layout_state()
+    if state is None or state != last_layout_state or layout_needs_full_redraw:
+        draw_layout()
+        pygame.display.update(dirty_rects)
+        dirty_rects.clear()
+    last_layout_state = state
+    # The plain window does not wait on vblank, so tick() is the only frame pacing.
     clock.tick(FPS)
 
 
@@ -806,9 +1089,7 @@ def close_hardware() -> None:
         bumper1,
         bumper2,
         ball_drain,
-        target1,
-        target2,
-        target3,
+        *DROP_TARGETS,
         goal_sensor,
         start_button,
     ):
@@ -833,13 +1114,13 @@ def main() -> None:
     try:
         initialize_all_gates()
         start_music()
+        preload_sounds()
         chosen_mode = show_start_screen()
 
         if chosen_mode == SystemMode.TEST_MODE:
             current_mode = SystemMode.TEST_MODE
             test_ctx = TestModeContext(
                 screen=SCREEN,
-                clock=clock,
                 width=SCREEN_WIDTH,
                 height=SCREEN_HEIGHT,
                 rink_img=rink_img,
@@ -859,6 +1140,8 @@ def main() -> None:
         # Raise the drop-target bank at the start of each new game.
         fire_drop_target_reset("startup")
         sync_drop_targets_after_reset()
+        sync_goal_sensor_edge_after_reset()
+        bind_hardware_callbacks()
         running = True
         while running:
             # End MEGA JACKPOT display after duration
@@ -866,12 +1149,13 @@ def main() -> None:
                 mega_jackpot = False
                 collected = 0
             running = handle_pygame_events()
-            poll_hardware_inputs()
+            dispatch_hardware_events()
             check_pending_drop_target_reset()
-            handle_keyboard_test_hit()
             check_game_over()
+            flush_high_score()
             render_frame()
     finally:
+        flush_high_score(force=True)
         close_hardware()
         pygame.quit()
 
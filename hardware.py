@@ -2,6 +2,10 @@
 # Falls back to mocks when GPIO is not available (e.g. on Windows).
 
 import atexit
+import contextlib
+import io
+import os
+import queue
 import threading
 import time
 from typing import Any
@@ -29,7 +33,27 @@ POPPER_GATE_ACTIVE_HIGH = True
 # GPIO setup (cross-platform safe)
 # ---------------------------------------------------------------------------
 try:
-    from gpiozero import Button, DigitalOutputDevice
+    from gpiozero import Button, Device, DigitalOutputDevice
+
+    # Prefer the lgpio (gpiochip character device) pin factory: edges are delivered by the
+    # kernel instead of being polled per pin in Python. Without lgpio, use the pigpio daemon
+    # (edge detection runs in pigpiod) if it is running. An explicit GPIOZERO_PIN_FACTORY
+    # wins; if neither is available, gpiozero's default factory is used.
+    if "GPIOZERO_PIN_FACTORY" not in os.environ:
+        try:
+            from gpiozero.pins.lgpio import LGPIOFactory
+
+            Device.pin_factory = LGPIOFactory()
+        except Exception:
+            try:
+                from gpiozero.pins.pigpio import PiGPIOFactory
+
+                # pigpio prints a "Did you start the pigpio daemon?" banner when it cannot
+                # connect; as an automatic fallback, a board without pigpiod should boot quietly.
+                with contextlib.redirect_stdout(io.StringIO()):
+                    Device.pin_factory = PiGPIOFactory()
+            except Exception:
+                pass
     print("GPIO detected: running on Raspberry Pi hardware.")
 
     # -----------------------------
@@ -133,38 +157,36 @@ except Exception as e:
     print(f"GPIO not available ({e}). Using mock mode for testing.")
     USE_GPIO = False
 
+    # Mocks carry no state, so one shared, slot-less instance of each stands in for every device.
     class MockButton:
-        @property
-        def is_pressed(self): 
-            return False
-        def close(self): 
+        __slots__ = ()
+        is_pressed = False
+
+        def close(self):
             pass
 
     class MockGate:
-        def on(self): 
+        __slots__ = ()
+
+        def on(self):
             pass
-        def off(self): 
+
+        def off(self):
             pass
-        def close(self): 
+
+        def close(self):
             pass
 
+    _MOCK_BUTTON = MockButton()
+    _MOCK_GATE = MockGate()
+
     # Mock versions
-    targets_any = MockButton()
-    bumper1 = MockButton()
-    bumper2 = MockButton()
-    target1 = MockButton()
-    target2 = MockButton()
-    target3 = MockButton()
-    goal_sensor = MockButton()
-    ball_drain = MockButton()
-    start_button = MockButton()
-
-    gate1 = MockGate()
-    gate2 = MockGate()
-    col = MockGate()
-    jackpot_gate = MockGate()
-    popper_gate = MockGate()
-    ball_kicker_gate = MockGate()
+    targets_any = bumper1 = bumper2 = _MOCK_BUTTON
+    target1 = target2 = target3 = _MOCK_BUTTON
+    goal_sensor = ball_drain = start_button = _MOCK_BUTTON
+
+    gate1 = gate2 = col = _MOCK_GATE
+    jackpot_gate = popper_gate = ball_kicker_gate = _MOCK_GATE
 
     _OUTPUT_BCM_PINS = ()
 
@@ -225,6 +247,28 @@ _patch_gpiozero_atexit_for_coil_pins()
 # Public API
 # ---------------------------------------------------------------------------
 
+# Every switch input by name (see read_all).
+INPUTS: dict[str, Any] = {
+    "targets_any": targets_any,
+    "bumper1": bumper1,
+    "bumper2": bumper2,
+    "target1": target1,
+    "target2": target2,
+    "target3": target3,
+    "goal_sensor": goal_sensor,
+    "ball_drain": ball_drain,
+    "start_button": start_button,
+}
+
+
+def read_all() -> dict[str, bool]:
+    """Snapshot every switch once (name -> pressed) so a frame works from one consistent view.
+
+    gpiozero already holds each line, so they cannot be re-requested as one gpiod bundle;
+    this keeps it to a single read per switch per frame.
+    """
+    return {name: device.is_pressed for name, device in INPUTS.items()}
+
 
 def initialize_all_gates() -> None:
     """Ensure all solenoid gates are off (safe state at startup)."""
@@ -243,3 +287,25 @@ def pulse_solenoid(gate: Any, pulse_time: float) -> None:
         gate.on()
         time.sleep(pulse_time)
         gate.off()
+
+
+# Coil pulses requested by game code run on one persistent worker instead of a new thread per fire.
+_pulse_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+
+def _pulse_worker() -> None:
+    """Fire queued coil pulses in order for the life of the process."""
+    while True:
+        gate, pulse_time = _pulse_queue.get()
+        try:
+            pulse_solenoid(gate, pulse_time)
+        except Exception as e:
+            print(f"⚠️ Solenoid pulse failed: {e}")
+
+
+threading.Thread(target=_pulse_worker, name="solenoid-pulse", daemon=True).start()
+
+
+def queue_pulse(gate: Any, pulse_time: float) -> None:
+    """Pulse gate for pulse_time seconds on the solenoid worker thread; returns immediately."""
+    _pulse_queue.put((gate, pulse_time))
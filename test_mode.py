@@ -3,28 +3,23 @@
 import os
 import sys
 import time
-import threading
 from dataclasses import dataclass
+from typing import Callable
 
+import numpy as np
 import pygame
 
 from audio import play_sound
 from hardware import (
+    INPUTS,
     USE_GPIO,
-    targets_any,
-    bumper1,
-    bumper2,
     gate1,
     gate2,
-    target1,
-    target2,
-    target3,
-    goal_sensor,
-    ball_drain,
     jackpot_gate,
     popper_gate,
     ball_kicker_gate,
-    pulse_solenoid,
+    queue_pulse,
+    read_all,
 )
 
 
@@ -44,15 +39,16 @@ _FIRE_KEYS = (
     getattr(pygame, "K_RETURN2", pygame.K_RETURN),
 )
 
+# (label, hardware.INPUTS name)
 SWITCH_LIST = [
-    ("Strike Plate", targets_any),
-    ("Bumper 1", bumper1),
-    ("Bumper 2", bumper2),
-    ("Drop Target 1", target1),
-    ("Drop Target 2", target2),
-    ("Drop Target 3", target3),
-    ("Goal Sensor", goal_sensor),
-    ("Ball Drain", ball_drain),
+    ("Strike Plate", "targets_any"),
+    ("Bumper 1", "bumper1"),
+    ("Bumper 2", "bumper2"),
+    ("Drop Target 1", "target1"),
+    ("Drop Target 2", "target2"),
+    ("Drop Target 3", "target3"),
+    ("Goal Sensor", "goal_sensor"),
+    ("Ball Drain", "ball_drain"),
 ]
 
 SOLENOID_LIST = [
@@ -68,8 +64,17 @@ SOLENOID_LIST = [
 
 TEST_SOUND_NAMES = ["hit", "bumper", "jackpot"]
 
+# Screen title -> subtitle, in LEFT/RIGHT navigation order.
+SCREENS = {
+    "SWITCH TEST": "Activate any switch to see its state.",
+    "SOLENOID TEST": "UP/DOWN to select, SPACE/ENTER to fire (safety cooldown).",
+    "DISPLAY TEST": "SPACE/ARROWS to cycle patterns. ESC to exit.",
+    "AUDIO TEST": "LEFT/RIGHT to pick sound, UP/DOWN volume, SPACE/ENTER to play.",
+    "SYSTEM STATUS": "Basic Raspberry Pi health.",
+}
+FOOTER_TEXT = "LEFT/RIGHT = Change Screen   ESC = Exit Test Mode"
+
 # Display
-FPS = 60
 HEADER_Y = 40
 SUBTITLE_Y = 80
 COLOR_HEADER = (255, 255, 0)
@@ -82,6 +87,16 @@ COLOR_FOOTER = (220, 220, 220)
 COLOR_WHITE = (255, 255, 255)
 DISPLAY_PATTERN_COLORS = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 255)]
 OVERLAY_ALPHA = 160
+# Posted from gpiozero callback threads so SWITCH TEST wakes from event.wait on a switch edge.
+SWITCH_CHANGED_EVENT = pygame.event.custom_type()
+GRADIENT_BAR_HEIGHT = 40
+GRADIENT_BAND_WIDTH = 10
+
+# SYSTEM STATUS readings (temperature, load) are refreshed at most this often.
+SYSTEM_STATUS_REFRESH_S = 1.0
+# SWITCH TEST re-reads every switch level this often, in case bounce_time swallowed an edge.
+SWITCH_RESYNC_S = 0.25
+CPU_TEMP_PATH = "/sys/class/thermal/thermal_zone0/temp"
 
 # ============================================================
 # CONTEXT
@@ -93,7 +108,6 @@ class TestModeContext:
     """Display and asset handles needed to draw test mode screens."""
 
     screen: pygame.Surface
-    clock: pygame.time.Clock
     width: int
     height: int
     rink_img: pygame.Surface
@@ -116,21 +130,107 @@ def _blit_centered(ctx: TestModeContext, surface: pygame.Surface, y: int) -> Non
     ctx.screen.blit(surface, (x, y))
 
 
-def _draw_header(ctx: TestModeContext, title: str, subtitle: str = "") -> None:
-    """Draw the standard TEST MODE header and optional subtitle."""
+def _render_header(ctx: TestModeContext, title: str, subtitle: str = "") -> list[tuple[pygame.Surface, int]]:
+    """Render the standard TEST MODE header and optional subtitle as (surface, y) pairs."""
+    header = [(ctx.medium_font.render(f"TEST MODE - {title}", True, COLOR_HEADER), HEADER_Y)]
+    if subtitle:
+        header.append((ctx.small_font.render(subtitle, True, COLOR_SUBTITLE), SUBTITLE_Y))
+    return header
+
+
+def _draw_header(ctx: TestModeContext, header: list[tuple[pygame.Surface, int]]) -> None:
+    """Draw the background and a header pre-rendered by _render_header."""
     ctx.screen.blit(ctx.rink_img, (0, 0))
     ctx.screen.blit(ctx.jumbo_img, (ctx.jumbo_x, ctx.jumbo_y))
-    header = ctx.medium_font.render(f"TEST MODE - {title}", True, COLOR_HEADER)
-    _blit_centered(ctx, header, HEADER_Y)
-    if subtitle:
-        sub = ctx.small_font.render(subtitle, True, COLOR_SUBTITLE)
-        _blit_centered(ctx, sub, SUBTITLE_Y)
+    for surface, y in header:
+        _blit_centered(ctx, surface, y)
+
+
+def _watch_switches(switch_state: dict[str, bool]) -> Callable[[], None]:
+    """Keep switch_state current from SWITCH_LIST edge callbacks instead of polling is_pressed.
+
+    Returns a function that puts back whatever callbacks were installed before.
+    """
+    if not USE_GPIO:
+        return lambda: None
+
+    def on_edge(name: str, pressed: bool) -> None:
+        switch_state[name] = pressed
+        pygame.event.post(pygame.event.Event(SWITCH_CHANGED_EVENT))
+
+    saved = []
+    for _label, name in SWITCH_LIST:
+        device = INPUTS[name]
+        saved.append((device, device.when_pressed, device.when_released))
+        device.when_pressed = lambda name=name: on_edge(name, True)
+        device.when_released = lambda name=name: on_edge(name, False)
+
+    def restore() -> None:
+        for device, when_pressed, when_released in saved:
+            device.when_pressed = when_pressed
+            device.when_released = when_released
+
+    return restore
+
+
+def _render_switch_labels(ctx: TestModeContext) -> list[tuple[pygame.Surface, pygame.Surface]]:
+    """(inactive, active) label surfaces for each SWITCH_LIST row."""
+    labels = []
+    for name, _input_name in SWITCH_LIST:
+        # For drop targets, show UP/DOWN instead of ACTIVE/INACTIVE
+        # Sensor is active (pressed) when target is UP, inactive when DOWN
+        off_text, on_text = ("DOWN", "UP") if "Drop Target" in name else ("INACTIVE", "ACTIVE")
+        labels.append((
+            ctx.small_font.render(f"{name:>14}: {off_text}", True, COLOR_INACTIVE),
+            ctx.small_font.render(f"{name:>14}: {on_text}", True, COLOR_ACTIVE),
+        ))
+    return labels
+
+
+def _render_menu_labels(ctx: TestModeContext, names: list[str]) -> list[tuple[pygame.Surface, pygame.Surface]]:
+    """(unselected, selected) label surfaces for each menu row."""
+    return [
+        (
+            ctx.small_font.render(f"  {name}", True, COLOR_NORMAL),
+            ctx.small_font.render(f"> {name}", True, COLOR_SELECTED),
+        )
+        for name in names
+    ]
+
+
+def _render_gradient_bar(width: int) -> pygame.Surface:
+    """DISPLAY TEST grayscale bar: GRADIENT_BAND_WIDTH-px bands from black to near-white."""
+    band_start = np.arange(width) // GRADIENT_BAND_WIDTH * GRADIENT_BAND_WIDTH
+    levels = (255 * band_start // width).astype(np.uint8)
+    pixels = np.broadcast_to(levels[:, None, None], (width, GRADIENT_BAR_HEIGHT, 3))
+    return pygame.surfarray.make_surface(np.ascontiguousarray(pixels)).convert()
+
+
+def _render_display_overlays(ctx: TestModeContext) -> list[pygame.Surface]:
+    """One full-screen translucent overlay per DISPLAY_PATTERN_COLORS entry."""
+    overlays = []
+    for color in DISPLAY_PATTERN_COLORS:
+        overlay = pygame.Surface((ctx.width, ctx.height), pygame.SRCALPHA)
+        overlay.fill((*color, OVERLAY_ALPHA))
+        overlays.append(overlay.convert_alpha())
+    return overlays
+
+
+def _render_volume_label(ctx: TestModeContext, volume: float) -> pygame.Surface:
+    """AUDIO TEST volume readout for the given level."""
+    return ctx.small_font.render(f"Volume: {volume:.2f}", True, COLOR_WHITE)
 
 
 def _get_cpu_temperature() -> str:
     """Best-effort CPU temperature (Raspberry Pi only). On Windows/other OS returns 'N/A'."""
     if sys.platform != "linux":
         return "N/A"
+    # Kernel thermal zone (millidegrees C): a file read, no subprocess.
+    try:
+        with open(CPU_TEMP_PATH) as f:
+            return f"{int(f.read().strip()) / 1000:.1f} C"
+    except (OSError, ValueError):
+        pass
     try:
         out = os.popen("vcgencmd measure_temp").read().strip()
         if out.startswith("temp="):
@@ -142,6 +242,14 @@ def _get_cpu_temperature() -> str:
     return "N/A"
 
 
+def _get_load_text() -> str:
+    try:
+        load1, load5, load15 = os.getloadavg()
+        return f"Load avg (1/5/15): {load1:.2f}, {load5:.2f}, {load15:.2f}"
+    except (AttributeError, OSError):
+        return "Load avg: N/A"
+
+
 def _format_uptime(program_start_time: float) -> str:
     seconds = int(time.time() - program_start_time)
     mins, secs = divmod(seconds, 60)
@@ -161,19 +269,45 @@ def run_test_mode(ctx: TestModeContext) -> None:
     - Navigable with keyboard arrows or physical bumper buttons.
     - Caller is responsible for setting current_mode before/after.
     """
-    screens = ["SWITCH TEST", "SOLENOID TEST", "DISPLAY TEST", "AUDIO TEST", "SYSTEM STATUS"]
+    switch_state = read_all()
+    restore_callbacks = _watch_switches(switch_state)
+    try:
+        _run_screens(ctx, switch_state)
+    finally:
+        restore_callbacks()
+
+
+def _run_screens(ctx: TestModeContext, switch_state: dict[str, bool]) -> None:
+    """TEST MODE event/render loop; switch_state is kept live by _watch_switches and resyncs."""
+    screens = list(SCREENS)
     screen_index = 0
     solenoid_index = 0
     sound_index = 0
     display_pattern = 0
     test_volume = 1.0
-    last_solenoid_fire = {i: 0.0 for i in range(len(SOLENOID_LIST))}
-
-    running = True
-    while running:
+    last_solenoid_fire = [0.0] * len(SOLENOID_LIST)
+
+    # Text only changes with switch state / selection / volume: render it once (or on change).
+    headers = {title: _render_header(ctx, title, subtitle) for title, subtitle in SCREENS.items()}
+    footer = ctx.small_font.render(FOOTER_TEXT, True, COLOR_FOOTER)
+    switch_labels = _render_switch_labels(ctx)
+    solenoid_labels = _render_menu_labels(ctx, [name for name, _gate, _pulse in SOLENOID_LIST])
+    sound_labels = _render_menu_labels(ctx, TEST_SOUND_NAMES)
+    gradient_bar = _render_gradient_bar(ctx.width)
+    display_overlays = _render_display_overlays(ctx)
+    vol_label = _render_volume_label(ctx, test_volume)
+    status_labels: list[pygame.Surface] = []
+    next_status_refresh = 0.0
+    next_switch_resync = 0.0
+    shown_title = None
+
+    # Only redraw when what is on screen changes; between changes, sleep in event.wait.
+    last_view = None
+    pending = pygame.event.Event(pygame.NOEVENT)
+    while True:
         now = time.time()
 
-        for e in pygame.event.get():
+        for e in (pending, *pygame.event.get()):
             if e.type == pygame.QUIT:
                 pygame.quit()
                 raise SystemExit
@@ -201,20 +335,18 @@ def run_test_mode(ctx: TestModeContext) -> None:
                                     "[TEST] WARNING: GPIO is in mock mode (USE_GPIO=False). Solenoids will not fire."
                                 )
                             print(f"[TEST] Firing solenoid: {name} (pulse={pulse_time:.2f}s)")
-                            threading.Thread(
-                                target=pulse_solenoid,
-                                args=(gate, pulse_time),
-                                daemon=True,
-                            ).start()
+                            queue_pulse(gate, pulse_time)
                             last_solenoid_fire[solenoid_index] = now
 
                 elif screens[screen_index] == "AUDIO TEST":
-                    if e.key == pygame.K_UP:
-                        test_volume = min(1.0, test_volume + TEST_VOLUME_STEP)
-                        pygame.mixer.music.set_volume(test_volume)
-                    elif e.key == pygame.K_DOWN:
-                        test_volume = max(0.0, test_volume - TEST_VOLUME_STEP)
-                        pygame.mixer.music.set_volume(test_volume)
+                    if e.key in (pygame.K_UP, pygame.K_DOWN):
+                        step = TEST_VOLUME_STEP if e.key == pygame.K_UP else -TEST_VOLUME_STEP
+                        new_volume = min(1.0, max(0.0, test_volume + step))
+                        # Already at a rail: nothing to tell the mixer or redraw.
+                        if new_volume != test_volume:
+                            test_volume = new_volume
+                            pygame.mixer.music.set_volume(test_volume)
+                            vol_label = _render_volume_label(ctx, test_volume)
                     elif e.key == pygame.K_LEFT:
                         sound_index = (sound_index - 1) % len(TEST_SOUND_NAMES)
                     elif e.key == pygame.K_RIGHT:
@@ -226,91 +358,77 @@ def run_test_mode(ctx: TestModeContext) -> None:
 
                 elif screens[screen_index] == "DISPLAY TEST":
                     if e.key in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE):
-                        display_pattern = (display_pattern + 1) % 4
+                        display_pattern = (display_pattern + 1) % len(DISPLAY_PATTERN_COLORS)
 
-        # ---- Render ----
+        # ---- Inputs that change the view ----
         current_title = screens[screen_index]
+        if current_title == "SWITCH TEST" and (current_title != shown_title or now >= next_switch_resync):
+            # Callbacks give fast updates; the real levels are re-read on entry and every
+            # SWITCH_RESYNC_S so a dropped edge cannot leave a wrong reading on screen.
+            switch_state.update(read_all())
+            next_switch_resync = now + SWITCH_RESYNC_S
+        shown_title = current_title
+        if current_title == "SYSTEM STATUS" and now >= next_status_refresh:
+            # Every line changes at most once a second (uptime is whole seconds).
+            lines = [
+                f"CPU Temp: {_get_cpu_temperature()}",
+                f"Uptime: {_format_uptime(ctx.program_start_time)}",
+                _get_load_text(),
+            ]
+            status_labels = [ctx.small_font.render(line, True, COLOR_WHITE) for line in lines]
+            next_status_refresh = now + SYSTEM_STATUS_REFRESH_S
 
-        if current_title == "SWITCH TEST":
-            _draw_header(ctx, "SWITCH TEST", "Activate any switch to see its state.")
-            y = 140
-            for name, btn in SWITCH_LIST:
-                active = getattr(btn, "is_pressed", False)
-                # For drop targets, show UP/DOWN instead of ACTIVE/INACTIVE
-                # Sensor is active (pressed) when target is UP, inactive when DOWN
-                if "Drop Target" in name:
-                    state_text = "UP" if active else "DOWN"
-                    color = COLOR_ACTIVE if active else COLOR_INACTIVE
-                else:
-                    state_text = "ACTIVE" if active else "INACTIVE"
-                    color = COLOR_ACTIVE if active else COLOR_INACTIVE
-                label = ctx.small_font.render(f"{name:>14}: {state_text}", True, color)
-                _blit_centered(ctx, label, y)
-                y += 30
-
-        elif current_title == "SOLENOID TEST":
-            _draw_header(
-                ctx,
-                "SOLENOID TEST",
-                "UP/DOWN to select, SPACE/ENTER to fire (safety cooldown).",
-            )
-            y = 150
-            for idx, (name, _gate, _pulse) in enumerate(SOLENOID_LIST):
-                prefix = ">" if idx == solenoid_index else " "
-                color = COLOR_SELECTED if idx == solenoid_index else COLOR_NORMAL
-                label = ctx.small_font.render(f"{prefix} {name}", True, color)
-                _blit_centered(ctx, label, y)
-                y += 32
-
-        elif current_title == "DISPLAY TEST":
-            _draw_header(ctx, "DISPLAY TEST", "SPACE/ARROWS to cycle patterns. ESC to exit.")
-            overlay_color = DISPLAY_PATTERN_COLORS[display_pattern]
-            overlay = pygame.Surface((ctx.width, ctx.height), pygame.SRCALPHA)
-            overlay.fill((*overlay_color, OVERLAY_ALPHA))
-            ctx.screen.blit(overlay, (0, 0))
-            bar_y = ctx.height - 80
-            for i in range(0, ctx.width, 10):
-                level = int(255 * (i / ctx.width))
-                pygame.draw.rect(ctx.screen, (level, level, level), (i, bar_y, 10, 40))
-
-        elif current_title == "AUDIO TEST":
-            _draw_header(
-                ctx,
-                "AUDIO TEST",
-                "LEFT/RIGHT to pick sound, UP/DOWN volume, SPACE/ENTER to play.",
-            )
-            y = 160
-            for idx, name in enumerate(TEST_SOUND_NAMES):
-                prefix = ">" if idx == sound_index else " "
-                color = COLOR_SELECTED if idx == sound_index else COLOR_NORMAL
-                label = ctx.small_font.render(f"{prefix} {name}", True, color)
-                _blit_centered(ctx, label, y)
-                y += 32
-            vol_label = ctx.small_font.render(f"Volume: {test_volume:.2f}", True, COLOR_WHITE)
-            _blit_centered(ctx, vol_label, y + 20)
-
-        elif current_title == "SYSTEM STATUS":
-            _draw_header(ctx, "SYSTEM STATUS", "Basic Raspberry Pi health.")
-            cpu_temp = _get_cpu_temperature()
-            uptime = _format_uptime(ctx.program_start_time)
-            try:
-                load1, load5, load15 = os.getloadavg()
-                load_text = f"Load avg (1/5/15): {load1:.2f}, {load5:.2f}, {load15:.2f}"
-            except (AttributeError, OSError):
-                load_text = "Load avg: N/A"
-            lines = [f"CPU Temp: {cpu_temp}", f"Uptime: {uptime}", load_text]
-            y = 150
-            for line in lines:
-                label = ctx.small_font.render(line, True, COLOR_WHITE)
-                _blit_centered(ctx, label, y)
-                y += 30
-
-        footer = ctx.small_font.render(
-            "LEFT/RIGHT = Change Screen   ESC = Exit Test Mode",
-            True,
-            COLOR_FOOTER,
+        # ---- Render ----
+        view = (
+            screen_index,
+            solenoid_index,
+            sound_index,
+            display_pattern,
+            test_volume,
+            tuple(switch_state.values()) if current_title == "SWITCH TEST" else None,
+            next_status_refresh,  # advances whenever status_labels is re-rendered
         )
-        _blit_centered(ctx, footer, ctx.height - 40)
-
-        pygame.display.flip()
-        ctx.clock.tick(FPS)
+        if view != last_view:
+            last_view = view
+            _draw_header(ctx, headers[current_title])
+
+            if current_title == "SWITCH TEST":
+                y = 140
+                for (_name, input_name), labels in zip(SWITCH_LIST, switch_labels):
+                    _blit_centered(ctx, labels[switch_state[input_name]], y)
+                    y += 30
+
+            elif current_title == "SOLENOID TEST":
+                y = 150
+                for idx, labels in enumerate(solenoid_labels):
+                    _blit_centered(ctx, labels[idx == solenoid_index], y)
+                    y += 32
+
+            elif current_title == "DISPLAY TEST":
+                ctx.screen.blit(display_overlays[display_pattern], (0, 0))
+                ctx.screen.blit(gradient_bar, (0, ctx.height - 80))
+
+            elif current_title == "AUDIO TEST":
+                y = 160
+                for idx, labels in enumerate(sound_labels):
+                    _blit_centered(ctx, labels[idx == sound_index], y)
+                    y += 32
+                _blit_centered(ctx, vol_label, y + 20)
+
+            elif current_title == "SYSTEM STATUS":
+                y = 150
+                for label in status_labels:
+                    _blit_centered(ctx, label, y)
+                    y += 30
+
+            _blit_centered(ctx, footer, ctx.height - 40)
+            pygame.display.flip()
+
+        # ---- Wait for the next input or refresh ----
+        # Switch edges arrive as SWITCH_CHANGED_EVENT; the timers only cover refreshes and resyncs.
+        if current_title == "SYSTEM STATUS":
+            pending = pygame.event.wait(max(1, int((next_status_refresh - time.time()) * 1000)))
+        elif current_title == "SWITCH TEST":
+            pending = pygame.event.wait(max(1, int((next_switch_resync - time.time()) * 1000)))
+        else:
+            pending = pygame.event.wait()